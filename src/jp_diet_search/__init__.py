@@ -1,10 +1,42 @@
-from .client import DietClient, DietSearchClient
-from .queries import MeetingListQuery, MeetingQuery, SpeechQuery
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
+    "AsyncDietClient",
     "DietClient",
     "DietSearchClient",
     "MeetingListQuery",
     "MeetingQuery",
     "SpeechQuery",
 ]
+
+# Public names are imported on first access so that `jp-diet-search --help`
+# does not have to import requests and pydantic.
+_EXPORTS = {
+    "AsyncDietClient": ".async_client",
+    "DietClient": ".client",
+    "DietSearchClient": ".client",
+    "MeetingListQuery": ".queries",
+    "MeetingQuery": ".queries",
+    "SpeechQuery": ".queries",
+}
+
+if TYPE_CHECKING:
+    from .async_client import AsyncDietClient
+    from .client import DietClient, DietSearchClient
+    from .queries import MeetingListQuery, MeetingQuery, SpeechQuery
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
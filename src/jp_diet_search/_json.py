@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional speed-up: pip install "jp-diet-search[fast]"
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, *, indent: int | None = None, ensure_ascii: bool = False) -> bytes:
+    """Encode JSON to UTF-8 bytes, laid out the way ``json.dumps`` would, using orjson when possible.
+
+    orjson output is equivalent JSON, not always the same text (e.g. floats are written
+    as ``1e+16`` rather than ``1e16``). orjson never escapes non-ASCII characters, only
+    supports 2-space indentation and rejects integers wider than 64 bits, so those cases
+    go through the stdlib. ``indent=None`` yields compact output.
+    """
+    if orjson is not None and not ensure_ascii and indent in (None, 2):
+        try:
+            if indent is None:
+                return orjson.dumps(obj)
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:  # orjson.JSONEncodeError, e.g. an int beyond 64 bits
+            pass
+
+    if indent is None:
+        text = json.dumps(obj, ensure_ascii=ensure_ascii, separators=(",", ":"))
+    else:
+        text = json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii)
+    return text.encode("utf-8")
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+from .client import DietClient
+
+
+class AsyncEndpoint:
+    """Awaitable view of an endpoint object; each call runs in a worker thread."""
+
+    def __init__(self, endpoint: Any) -> None:
+        self._endpoint = endpoint
+
+    async def search(self, query: Any, *, limit_total: Optional[int] = None) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._endpoint.search, query, limit_total=limit_total)
+
+    async def count(self, query: Any) -> int:
+        return await asyncio.to_thread(self._endpoint.count, query)
+
+    async def search_any(self, text: str, **kwargs: Any) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._endpoint.search_any, text, **kwargs)
+
+    async def search_iter(self, query: Any, *, limit_total: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield records as pages arrive, without blocking the event loop.
+
+        Each page is fetched in a worker thread and its records are yielded before the next
+        page is awaited. Leaving the loop early stops the underlying search.
+        """
+        pages = self._endpoint.search_pages(query, limit_total=limit_total)
+        try:
+            while True:
+                records = await asyncio.to_thread(next, pages, None)
+                if records is None:
+                    return
+                for record in records:
+                    yield record
+        finally:
+            # Closing joins the prefetch workers, so keep it off the event loop too.
+            await asyncio.to_thread(pages.close)
+
+
+class AsyncSpeechEndpoint(AsyncEndpoint):
+    async def search_by_speaker(self, speaker: str, **kwargs: Any) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._endpoint.search_by_speaker, speaker, **kwargs)
+
+
+class AsyncDietClient:
+    """asyncio front end for :class:`DietClient`.
+
+    Accepts the same keyword arguments as ``DietClient``. Requests still go through the
+    shared ``requests`` session, connection pool, cache and ``sleep_seconds`` limiter,
+    but run in worker threads, so independent searches can be combined with
+    ``asyncio.gather``.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.sync = DietClient(**kwargs)
+
+        self.meeting_list = AsyncEndpoint(self.sync.meeting_list)
+        self.meeting = AsyncEndpoint(self.sync.meeting)
+        self.speech = AsyncSpeechEndpoint(self.sync.speech)
+
+    async def prune_cache(self, max_age: float | None = None) -> int:
+        return await asyncio.to_thread(self.sync.prune_cache, max_age)
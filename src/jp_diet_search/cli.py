@@ -1,26 +1,61 @@
 from __future__ import annotations
 
 import argparse
-import json
+import codecs
+import contextlib
+import csv
+import functools
+import io
+import itertools
+import operator
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
-from .client import DietClient
-from .queries import MeetingListQuery, MeetingQuery, SpeechQuery
+from ._json import dumps_bytes
+
+_JSONL_FLUSH_EVERY = 100
+
+_T = TypeVar("_T")
 
 
 def _add_common_client_args(p: argparse.ArgumentParser) -> None:
     p.add_argument("--base-url", default="https://kokkai.ndl.go.jp/api", help="API base URL.")
     p.add_argument("--timeout", type=float, default=10.0, help="HTTP timeout in seconds.")
     p.add_argument("--user-agent", default="jp-diet-search", help="User-Agent string.")
-    p.add_argument("--sleep-seconds", type=float, default=2.0, help="Sleep seconds between paginated API calls.")
+    p.add_argument("--sleep-seconds", type=float, default=2.0, help="Minimum seconds between API calls (cache hits are not delayed).")
+    p.add_argument(
+        "--max-workers",
+        type=int,
+        default=1,
+        help="Fetch up to this many result pages concurrently (default: 1). --sleep-seconds still applies.",
+    )
     p.add_argument("--cache-dir", default=None, help="Cache directory path (optional).")
+    p.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        help="Seconds before a cached response is revalidated with the API (default: never).",
+    )
     p.add_argument("--limit-total", type=int, default=None, help="Stop pagination after collecting this many records.")
+    p.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report numberOfRecords for the query (one request, no records are fetched).",
+    )
     p.add_argument(
         "--output",
         default="-",
-        help="Output JSON path. Use '-' to write to stdout (default).",
+        help="Output path. Use '-' to write to stdout (default).",
+    )
+    p.add_argument(
+        "--format",
+        dest="output_format",
+        choices=["json", "jsonl", "csv"],
+        default="json",
+        help="Output format: one aggregated JSON document (default), or one record per line "
+             "(jsonl / csv) written as pages arrive.",
     )
     p.add_argument("--indent", type=int, default=2, help="JSON indent level (default: 2).")
     p.add_argument("--no-ascii", action="store_true", help="Do not escape non-ASCII characters in JSON output.")
@@ -61,6 +96,7 @@ def _add_common_query_args(p: argparse.ArgumentParser) -> None:
     p.add_argument("--issue-to", type=int, default=None, help="issueTo")
 
 
+@functools.lru_cache(maxsize=1)
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(
         prog="jp-diet-search",
@@ -108,6 +144,29 @@ examples:
     return p
 
 
+# Query fields copied from argparse when set (and non-empty).
+_QUERY_FILTER_KEYS = (
+    "name_of_house",
+    "name_of_meeting",
+    "any",
+    "speaker",
+    "from_date",
+    "until_date",
+    "search_range",
+    "speech_number",
+    "speaker_position",
+    "speaker_group",
+    "speaker_role",
+    "speech_id",
+    "issue_id",
+    "session_from",
+    "session_to",
+    "issue_from",
+    "issue_to",
+)
+_get_query_filters = operator.attrgetter(*_QUERY_FILTER_KEYS)
+
+
 def _query_kwargs_from_args(args: argparse.Namespace) -> Dict[str, Any]:
     # Only pass fields that are actually set; Query objects validate "at least one condition".
     d: Dict[str, Any] = {}
@@ -121,26 +180,7 @@ def _query_kwargs_from_args(args: argparse.Namespace) -> Dict[str, Any]:
         d["record_packing"] = args.record_packing
 
     # filters
-    for k in [
-        "name_of_house",
-        "name_of_meeting",
-        "any",
-        "speaker",
-        "from_date",
-        "until_date",
-        "search_range",
-        "speech_number",
-        "speaker_position",
-        "speaker_group",
-        "speaker_role",
-        "speech_id",
-        "issue_id",
-        "session_from",
-        "session_to",
-        "issue_from",
-        "issue_to",
-    ]:
-        v = getattr(args, k, None)
+    for k, v in zip(_QUERY_FILTER_KEYS, _get_query_filters(args)):
         if v not in (None, ""):
             d[k] = v
 
@@ -155,6 +195,59 @@ def _query_kwargs_from_args(args: argparse.Namespace) -> Dict[str, Any]:
     return d
 
 
+def _started(items: Iterable[_T]) -> Iterator[_T]:
+    """Pull the first item now, so errors from the first request surface before any output exists."""
+    it = iter(items)
+    for first in it:
+        return itertools.chain([first], it)
+    return iter(())
+
+
+class _TextSink(io.RawIOBase):
+    """Binary adapter for a text-only stdout (e.g. redirect_stdout(StringIO()), Jupyter)."""
+
+    def __init__(self, stream: Any) -> None:
+        self._stream = stream
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b: Any) -> int:
+        self._stream.write(self._decoder.decode(bytes(b)))
+        return len(b)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+
+@contextlib.contextmanager
+def _open_output(output: str) -> Iterator[BinaryIO]:
+    # JSON is encoded straight to UTF-8 bytes, so write to the binary stream.
+    if output == "-" or output.strip() == "":
+        sys.stdout.flush()
+        out = getattr(sys.stdout, "buffer", None) or _TextSink(sys.stdout)
+        try:
+            yield out
+        finally:
+            out.flush()
+        return
+
+    out_path = Path(output).expanduser()
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    # Records are written while later pages are still being fetched: write aside and only
+    # replace the target once everything succeeded, so a failed run never leaves a
+    # truncated file (or clobbers an existing one).
+    tmp_path = out_path.with_name(f".{out_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            yield f
+        os.replace(tmp_path, out_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _write_json(obj: Any, *, output: str, indent: int, ensure_ascii: bool) -> None:
     # Support pydantic models (v2) and plain dicts.
     if hasattr(obj, "model_dump"):
@@ -164,14 +257,72 @@ def _write_json(obj: Any, *, output: str, indent: int, ensure_ascii: bool) -> No
     else:
         payload = obj
 
-    text = json.dumps(payload, indent=indent, ensure_ascii=ensure_ascii)
-    if output == "-" or output.strip() == "":
-        sys.stdout.write(text + "\n")
-        return
-
-    out_path = Path(output).expanduser()
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(text + "\n", encoding="utf-8")
+    data = dumps_bytes(payload, indent=indent, ensure_ascii=ensure_ascii)
+    with _open_output(output) as f:
+        f.write(data + b"\n")
+
+
+def _write_json_stream(
+    items: Iterable[Tuple[str, Any]], *, output: str, indent: int, ensure_ascii: bool
+) -> None:
+    """Write a search result object whose ``"records"`` value is an iterator, one record at a time.
+
+    Produces the same layout as ``json.dumps(..., indent=indent)`` without ever holding
+    all records in memory.
+    """
+
+    def _encode(value: Any, level: int) -> bytes:
+        data = dumps_bytes(value, indent=indent, ensure_ascii=ensure_ascii)
+        return data.replace(b"\n", b"\n" + b" " * (indent * level))
+
+    pad1 = b"\n" + b" " * indent
+    pad2 = b"\n" + b" " * (indent * 2)
+
+    with _open_output(output) as f:
+        f.write(b"{")
+        for i, (key, value) in enumerate(items):
+            f.write((b"," if i else b"") + pad1 + dumps_bytes(key, ensure_ascii=ensure_ascii) + b": ")
+            if key != "records":
+                f.write(_encode(value, 1))
+                continue
+
+            f.write(b"[")
+            n = 0
+            for n, rec in enumerate(value, start=1):
+                f.write((b"," if n > 1 else b"") + pad2 + _encode(rec, 2))
+                if n % _JSONL_FLUSH_EVERY == 0:
+                    f.flush()
+            f.write((pad1 if n else b"") + b"]")
+        f.write(b"\n}\n")
+
+
+def _write_jsonl(records: Iterable[Dict[str, Any]], *, output: str, ensure_ascii: bool) -> None:
+    # Records are written as they are fetched so memory stays bounded by the prefetch window.
+    with _open_output(output) as f:
+        for i, rec in enumerate(records, start=1):
+            f.write(dumps_bytes(rec, ensure_ascii=ensure_ascii))
+            f.write(b"\n")
+            if i % _JSONL_FLUSH_EVERY == 0:
+                f.flush()
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return dumps_bytes(value).decode("utf-8")
+    return value
+
+
+def _write_csv(records: Iterable[Dict[str, Any]], *, output: str, fieldnames: List[str]) -> None:
+    with _open_output(output) as raw:
+        f = io.TextIOWrapper(raw, encoding="utf-8", newline="", write_through=True)
+        try:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows([_csv_cell(rec.get(k)) for k in fieldnames] for rec in records)
+        finally:
+            f.detach()  # leave the underlying stream open
 
 
 def main(argv: Optional[list[str]] = None) -> int:
@@ -186,12 +337,22 @@ def main(argv: Optional[list[str]] = None) -> int:
 
     args = parser.parse_args(argv)
 
+    # Imported late so `--help` and usage errors don't pay for requests/pydantic.
+    from .client import DietClient
+    from .models import MeetingRecord, SpeechRecord, api_field_names
+    from .queries import MeetingListQuery, MeetingQuery, SpeechQuery
+
+    if args.max_workers < 1:
+        parser.error(f"--max-workers must be positive: {args.max_workers}")
+
     client = DietClient(
         base_url=args.base_url,
         timeout=args.timeout,
         user_agent=args.user_agent,
         sleep_seconds=args.sleep_seconds,
+        max_workers=args.max_workers,
         cache_dir=args.cache_dir,
+        cache_ttl=args.cache_ttl,
     )
 
     q_kwargs = _query_kwargs_from_args(args)
@@ -199,15 +360,45 @@ def main(argv: Optional[list[str]] = None) -> int:
     try:
         if args.cmd in ("meeting-list", "meeting_list", "meetinglist"):
             q = MeetingListQuery(**q_kwargs)
-            res = client.meeting_list.search(q, limit_total=args.limit_total)
+            endpoint = client.meeting_list
+            model = MeetingRecord
         elif args.cmd == "meeting":
             q = MeetingQuery(**q_kwargs)
-            res = client.meeting.search(q, limit_total=args.limit_total)
+            endpoint = client.meeting
+            model = MeetingRecord
         elif args.cmd == "speech":
             q = SpeechQuery(**q_kwargs)
-            res = client.speech.search(q, limit_total=args.limit_total)
+            endpoint = client.speech
+            model = SpeechRecord
         else:
             raise RuntimeError(f"Unknown command: {args.cmd}")
+
+        if args.dry_run:
+            res = {"numberOfRecords": endpoint.count(q)}
+        elif args.output_format == "jsonl":
+            _write_jsonl(
+                _started(endpoint.search_iter(q, limit_total=args.limit_total)),
+                output=args.output,
+                ensure_ascii=not args.no_ascii,
+            )
+            return 0
+        elif args.output_format == "csv":
+            _write_csv(
+                _started(endpoint.search_iter(q, limit_total=args.limit_total)),
+                output=args.output,
+                # Fixed schema (API field names in model order) so rows can be written as they arrive.
+                fieldnames=api_field_names(model),
+            )
+            return 0
+        else:
+            _write_json_stream(
+                # The head item is only yielded once page 1 has been fetched.
+                _started(endpoint.search_items(q, limit_total=args.limit_total)),
+                output=args.output,
+                indent=args.indent,
+                ensure_ascii=not args.no_ascii,
+            )
+            return 0
     except Exception as e:
         parser.error(str(e))
         return 2
@@ -22,6 +22,10 @@ class DietClient:
         sleep_seconds: float = 0.0,
         cache_dir: str | Path | None = None,
         session: requests.Session | None = None,
+        max_workers: int = 1,
+        mem_cache_size: int = 128,
+        cache_ttl: float | None = None,
+        cache_full: bool = True,
     ) -> None:
         self._core = _DietCore(
             base_url=base_url,
@@ -30,12 +34,20 @@ class DietClient:
             sleep_seconds=sleep_seconds,
             cache_dir=cache_dir,
             session=session,
+            max_workers=max_workers,
+            mem_cache_size=mem_cache_size,
+            cache_ttl=cache_ttl,
+            cache_full=cache_full,
         )
 
         self.meeting_list = MeetingListEndpoint(self._core)
         self.meeting = MeetingEndpoint(self._core)
         self.speech = SpeechEndpoint(self._core)
 
+    def prune_cache(self, max_age: float | None = None) -> int:
+        """Delete cached responses older than ``max_age`` seconds (default: ``cache_ttl``)."""
+        return self._core.prune_cache(max_age)
+
     # ---------------- legacy-compatible methods ----------------
     # These keep your original "dict-of-params" calls working, but forward to the object API.
 
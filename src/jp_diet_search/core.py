@@ -1,22 +1,91 @@
 from __future__ import annotations
 
 import hashlib
-import json
+import itertools
+import os
+import re
+import threading
 import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from ._json import dumps_bytes, loads
 from .exceptions import (
     DietSearchAPIError,
     DietSearchRequestError,
     DietSearchRateLimitError,
     DietSearchParseError,
 )
+from .models import MeetingRecord, SpeechRecord, api_field_names
 
 BASE_URL = "https://kokkai.ndl.go.jp/api"
 
+# API parameters that count as a search condition; at least one must be set.
+_REQUIRED_ANY_KEYS = frozenset({
+    "nameOfHouse",
+    "nameOfMeeting",
+    "any",
+    "speaker",
+    "from",
+    "until",
+    "speechNumber",
+    "speakerPosition",
+    "speakerGroup",
+    "speakerRole",
+    "speechID",
+    "issueID",
+    "sessionFrom",
+    "sessionTo",
+    "issueFrom",
+    "issueTo",
+})
+
+# Record fields kept when `cache_full=False` (everything the record models know about).
+_MEETING_FIELDS = frozenset(api_field_names(MeetingRecord))
+_SPEECH_FIELDS = frozenset(api_field_names(SpeechRecord))
+
+
+def _project_page(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop record fields the models don't define, including speeches nested in meetings."""
+
+    def _project(rec: Any, fields: frozenset[str]) -> Any:
+        if not isinstance(rec, dict):
+            return rec
+        out = {k: v for k, v in rec.items() if k in fields}
+        if isinstance(out.get("speechRecord"), list):
+            out["speechRecord"] = [_project(s, _SPEECH_FIELDS) for s in out["speechRecord"]]
+        return out
+
+    data = dict(data)
+    if isinstance(data.get("meetingRecord"), list):
+        data["meetingRecord"] = [_project(m, _MEETING_FIELDS) for m in data["meetingRecord"]]
+    if isinstance(data.get("speechRecord"), list):
+        data["speechRecord"] = [_project(s, _SPEECH_FIELDS) for s in data["speechRecord"]]
+    return data
+
+
+# Connection pool + retry policy for sessions created by the core (user sessions are left as-is).
+_POOL_MAXSIZE = 32
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET"]),
+    raise_on_status=False,  # hand the final response back so HTTP errors map to our exceptions
+)
+
+# Files written by the cache: "<key>.json" entries and "<key>.json.<pid>.<tid>.tmp" temp files.
+_CACHE_FILE_RE = re.compile(r"[0-9a-f]{32}\.json(?:\.\d+\.\d+\.tmp)?")
+
+# Concurrent page fetches run at most this many pages per worker ahead of the consumer.
+_WINDOW_PER_WORKER = 2
+
 
 class _DietCore:
     """Internal HTTP + cache + pagination core.
@@ -34,68 +103,235 @@ class _DietCore:
             sleep_seconds: float = 0.0,
             cache_dir: str | Path | None = None,
             session: requests.Session | None = None,
+            max_workers: int = 1,
+            mem_cache_size: int = 128,
+            cache_ttl: float | None = None,
+            cache_full: bool = True,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.user_agent = user_agent
         self.timeout = timeout
         self.sleep_seconds = sleep_seconds
 
+        # Rate limiting: network calls are spaced at least `sleep_seconds` apart (cache hits are free).
+        self._next_allowed_at = 0.0
+        self._throttle_lock = threading.Lock()
+
+        if max_workers < 1:
+            raise DietSearchRequestError(f"max_workers must be positive: {max_workers}")
+        self.max_workers = max_workers
+
         if cache_dir is not None:
             self.cache_dir = Path(cache_dir).expanduser()
             self.cache_dir.mkdir(parents=True, exist_ok=True)
         else:
             self.cache_dir = None
 
-        self.session = session or requests.Session()
+        # Entries older than `cache_ttl` seconds are revalidated (None: never expire).
+        self.cache_ttl = cache_ttl
+
+        # cache_full=False trims records to the model fields before caching/returning them.
+        self.cache_full = cache_full
+
+        # In-process LRU in front of the on-disk cache (only used together with cache_dir).
+        if mem_cache_size < 0:
+            raise DietSearchRequestError(f"mem_cache_size must not be negative: {mem_cache_size}")
+        self.mem_cache_size = mem_cache_size
+        # Entries are kept encoded and decoded on every hit, so callers never share record objects.
+        self._mem_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._mem_cache_lock = threading.Lock()
+
+        if session is None:
+            session = requests.Session()
+            # One pool per host, large enough that concurrent page fetches never wait for a connection.
+            adapter = HTTPAdapter(pool_maxsize=max(_POOL_MAXSIZE, max_workers), max_retries=_RETRY)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         self.session.headers.update({"User-Agent": self.user_agent})
 
     # ---------------- cache ----------------
 
     def _cache_key(self, endpoint: str, params: Dict[str, Any]) -> str:
-        payload = {"endpoint": endpoint, "params": dict(sorted(params.items(), key=lambda kv: kv[0]))}
-        raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
-        digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
-        return f"{digest}.json"
+        # Non-cryptographic use: BLAKE2b is faster than SHA-256 and 16 bytes is plenty for file names.
+        # Fields are fed to the hasher directly; NUL separators can't occur in query text,
+        # so e.g. any="a&speaker=b" can't collide with any="a", speaker="b".
+        h = hashlib.blake2b(digest_size=16, usedforsecurity=False)
+        if not self.cache_full:
+            # Trimmed bodies live under their own keys, so clients sharing cache_dir with
+            # cache_full=True never get trimmed records (full-mode keys are unchanged).
+            h.update(b"\0trimmed\0")
+        h.update(endpoint.encode("utf-8"))
+        for k, v in sorted(params.items()):
+            h.update(b"\0")
+            h.update(k.encode("utf-8"))
+            h.update(b"\0")
+            h.update(str(v).encode("utf-8"))
+        return f"{h.hexdigest()}.json"
+
+    def _mem_cache_get(self, key: str) -> Optional[bytes]:
+        if not self.mem_cache_size:
+            return None
+        with self._mem_cache_lock:
+            data = self._mem_cache.get(key)
+            if data is not None:
+                self._mem_cache.move_to_end(key)
+            return data
+
+    def _mem_cache_put(self, key: str, data: bytes) -> None:
+        if not self.mem_cache_size:
+            return
+        with self._mem_cache_lock:
+            self._mem_cache[key] = data
+            self._mem_cache.move_to_end(key)
+            while len(self._mem_cache) > self.mem_cache_size:
+                self._mem_cache.popitem(last=False)
 
     def _load_from_cache(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cache entry ``{"_meta": {...}, "body": {...}}``, fresh or not."""
         if self.cache_dir is None:
             return None
-        cache_file = self.cache_dir / self._cache_key(endpoint, params)
-        if not cache_file.exists():
-            return None
+        key = self._cache_key(endpoint, params)
+        raw = self._mem_cache_get(key)
+        from_disk = raw is None
         try:
-            with cache_file.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
+            if from_disk:
+                raw = (self.cache_dir / key).read_bytes()
+            entry = loads(raw)
+        except (OSError, ValueError):
             return None
+        if not isinstance(entry, dict) or "_meta" not in entry or "body" not in entry:
+            return None
+        if from_disk:
+            self._mem_cache_put(key, raw)
+        return entry
 
-    def _save_to_cache(self, endpoint: str, params: Dict[str, Any], data: Dict[str, Any]) -> None:
+    def _save_to_cache(
+            self,
+            endpoint: str,
+            params: Dict[str, Any],
+            data: Dict[str, Any],
+            *,
+            etag: str | None = None,
+            last_modified: str | None = None,
+    ) -> None:
         if self.cache_dir is None:
             return
-        cache_file = self.cache_dir / self._cache_key(endpoint, params)
+        key = self._cache_key(endpoint, params)
+        entry = {
+            "_meta": {"etag": etag, "last_modified": last_modified, "t": time.time()},
+            "body": data,
+        }
+        cache_file = self.cache_dir / key
+        # Per-writer temp name: threads or processes sharing cache_dir never write the same file.
+        tmp_file = self.cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
         try:
-            with cache_file.open("w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False)
+            raw = dumps_bytes(entry)
+            self._mem_cache_put(key, raw)
+            # Write aside and rename so readers never see a partially written entry.
+            tmp_file.write_bytes(raw)
+            os.replace(tmp_file, cache_file)
         except Exception:
             # cache failures should never break the client
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             return
 
+    def _is_fresh(self, entry: Dict[str, Any]) -> bool:
+        if self.cache_ttl is None:
+            return True
+        try:
+            age = time.time() - float(entry["_meta"]["t"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return age < self.cache_ttl
+
+    def prune_cache(self, max_age: float | None = None) -> int:
+        """Delete cache files older than ``max_age`` seconds (default: ``cache_ttl``).
+
+        Temporary files older than the cutoff (abandoned writes) are removed too; younger
+        ones may belong to a write still in progress. Returns the number of deleted files.
+        """
+        if self.cache_dir is None:
+            return 0
+        if max_age is None:
+            max_age = self.cache_ttl
+        if max_age is None:
+            raise DietSearchRequestError("prune_cache() needs max_age when cache_ttl is not set")
+
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            # Only touch files this cache wrote; cache_dir may be shared with other files.
+            if not _CACHE_FILE_RE.fullmatch(path.name):
+                continue
+            try:
+                # Entries are rewritten whenever they are (re)validated, so mtime is their age.
+                if path.stat().st_mtime >= cutoff:
+                    continue
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+            with self._mem_cache_lock:
+                self._mem_cache.pop(path.name, None)
+        return removed
+
     # ---------------- request ----------------
 
-    def _request_json(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    def _throttle(self) -> None:
+        """Block until the next request slot; slots are shared by all threads of this core."""
+        if not self.sleep_seconds:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_allowed_at - now
+            self._next_allowed_at = max(now, self._next_allowed_at) + self.sleep_seconds
+        if wait > 0:
+            time.sleep(wait)
+
+    @staticmethod
+    def _prepare_params(params: Dict[str, Any]) -> Dict[str, Any]:
         # Drop None values and force JSON output unless caller explicitly sets it.
         params = {k: v for k, v in params.items() if v is not None}
         params.setdefault("recordPacking", "json")
+        return params
+
+    def _request_json(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._get_json(endpoint, self._prepare_params(params))
 
+    def _get_json(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache lookup + GET for params already passed through ``_prepare_params``."""
         cached = self._load_from_cache(endpoint, params)
+        if cached is not None and self._is_fresh(cached):
+            return cached["body"]
+
+        # A stale entry with validators is revalidated with a conditional GET.
+        headers: Dict[str, str] = {}
         if cached is not None:
-            return cached
+            meta = cached["_meta"]
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
 
+        self._throttle()
         try:
-            r = self.session.get(endpoint, params=params, timeout=self.timeout)
+            r = self.session.get(endpoint, params=params, timeout=self.timeout, headers=headers or None)
         except requests.RequestException as e:
             raise DietSearchRequestError(f"Request failed: {e}") from e
 
+        if r.status_code == 304 and headers:
+            meta = cached["_meta"]
+            self._save_to_cache(
+                endpoint, params, cached["body"],
+                etag=r.headers.get("ETag") or meta.get("etag"),
+                last_modified=r.headers.get("Last-Modified") or meta.get("last_modified"),
+            )
+            return cached["body"]
+
         # 🔹 NEW: rate limit handling
         if r.status_code == 429:
             body = (r.text or "").strip()
@@ -114,38 +350,27 @@ class _DietCore:
 
         # 🔹 NEW: parse-specific exception
         try:
-            data = r.json()
-        except Exception as e:
+            data = loads(r.content)
+        except ValueError as e:  # json/orjson JSONDecodeError (and bad UTF-8) are ValueErrors
             raise DietSearchParseError(
                 f"Failed to parse JSON response: {e}"
             ) from e
 
-        self._save_to_cache(endpoint, params, data)
+        if not self.cache_full and isinstance(data, dict):
+            data = _project_page(data)
+
+        self._save_to_cache(
+            endpoint, params, data,
+            etag=r.headers.get("ETag"),
+            last_modified=r.headers.get("Last-Modified"),
+        )
         return data
 
     # ---------------- validation helpers ----------------
 
     def check_required_any_condition(self, params: Dict[str, Any]) -> None:
         """Match the original behavior: at least one search condition is required."""
-        keys = {
-            "nameOfHouse",
-            "nameOfMeeting",
-            "any",
-            "speaker",
-            "from",
-            "until",
-            "speechNumber",
-            "speakerPosition",
-            "speakerGroup",
-            "speakerRole",
-            "speechID",
-            "issueID",
-            "sessionFrom",
-            "sessionTo",
-            "issueFrom",
-            "issueTo",
-        }
-        if not any(k in params and params[k] not in ("", None) for k in keys):
+        if not any(params[k] not in ("", None) for k in params.keys() & _REQUIRED_ANY_KEYS):
             # keep message compatible with earlier client.py
             raise DietSearchAPIError("検索条件を指定してください。", [])
 
@@ -163,53 +388,156 @@ class _DietCore:
 
     # ---------------- pagination search ----------------
 
-    def search_records(
+    def count(self, *, endpoint: str, params: Dict[str, Any], validated: bool = False) -> int:
+        """Return ``numberOfRecords`` for a search, fetching a single record and no pages."""
+        if not validated:
+            self.check_required_any_condition(params)
+        data = self._request_json(endpoint, {**params, "maximumRecords": 1})
+        try:
+            return int(data.get("numberOfRecords", 0))
+        except (TypeError, ValueError) as e:
+            raise DietSearchParseError(f"Unexpected 'numberOfRecords': {data.get('numberOfRecords')!r}") from e
+
+    @staticmethod
+    def _last_position(
+            data: Dict[str, Any],
+            params: Dict[str, Any],
+            limit_total: Optional[int],
+    ) -> Optional[int]:
+        """Position of the last record worth fetching, or None when ``numberOfRecords`` is unknown."""
+        try:
+            last = int(data["numberOfRecords"])
+            start = int(params["startRecord"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if limit_total is not None:
+            last = min(last, start + limit_total - 1)
+        return last
+
+    @staticmethod
+    def _limit_position(params: Dict[str, Any], limit_total: Optional[int]) -> Optional[int]:
+        """Position of the last record allowed by ``limit_total`` (None: no limit)."""
+        if limit_total is None:
+            return None
+        return int(params["startRecord"]) + limit_total - 1
+
+    @staticmethod
+    def _page_params(params: Dict[str, Any], pos: Any, stop: Optional[int]) -> Dict[str, Any]:
+        """Params for the page at ``pos``, asking for no records past position ``stop``."""
+        page = {**params, "startRecord": pos}
+        if stop is not None:
+            page["maximumRecords"] = max(1, min(int(params["maximumRecords"]), stop - int(pos) + 1))
+        return page
+
+    def _remaining_offsets(
+            self,
+            data: Dict[str, Any],
+            params: Dict[str, Any],
+            limit_total: Optional[int],
+    ) -> Optional[List[int]]:
+        """Compute the ``startRecord`` of every page after the first one.
+
+        Returns None when the first page lacks the metadata needed to know the
+        offsets up front; the caller then falls back to following ``nextRecordPosition``.
+        """
+        last = self._last_position(data, params, limit_total)
+        try:
+            next_pos = int(data["nextRecordPosition"])
+            # Stride by what the server actually served: it may cap pages below maximumRecords.
+            page_size = next_pos - int(params["startRecord"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if last is None or page_size <= 0:
+            return None
+        return list(range(next_pos, last + 1, page_size))
+
+    def _iter_pages(
             self,
-            *,
             endpoint: str,
-            record_key: str,
             params: Dict[str, Any],
             limit_total: Optional[int] = None,
-    ) -> Dict[str, Any]:
-        """Fetch pages and aggregate records.
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield raw page payloads in offset order, starting at ``params["startRecord"]``.
+
+        With ``max_workers > 1``, the pages after the first one are fetched concurrently,
+        since their offsets are known once the first page reports ``numberOfRecords``;
+        at most ``2 * max_workers`` pages are fetched ahead of the caller, and
+        ``sleep_seconds`` still applies across all workers. Otherwise pages are fetched
+        one at a time by following ``nextRecordPosition``, prefetching the next page in
+        the background while the caller processes the current one. Pages beyond
+        ``limit_total`` / ``numberOfRecords`` are not requested, and a page that would
+        cross ``limit_total`` only asks for the records still needed.
+        """
+        stop = self._limit_position(params, limit_total)
+        data = self._get_json(endpoint, self._page_params(params, params["startRecord"], stop))
+
+        if self.max_workers > 1 and data.get("nextRecordPosition"):
+            offsets = self._remaining_offsets(data, params, limit_total)
+            if offsets is not None:
+                pool = ThreadPoolExecutor(max_workers=self.max_workers)
+                pending = iter(offsets)
+                window: Deque[Future] = deque()
+
+                def _top_up() -> None:
+                    # Keep only a bounded number of pages in flight or waiting to be consumed.
+                    while len(window) < _WINDOW_PER_WORKER * self.max_workers:
+                        pos = next(pending, None)
+                        if pos is None:
+                            return
+                        window.append(pool.submit(self._get_json, endpoint, self._page_params(params, pos, stop)))
 
-        This method returns an aggregated structure intended for *human / script* use,
-        while still preserving key fields from the Diet Search API response.
+                try:
+                    _top_up()
+                    yield data
+                    while window:
+                        page = window.popleft().result()
+                        _top_up()
+                        yield page
+                finally:
+                    pool.shutdown(wait=True, cancel_futures=True)
+                return
+
+        last = self._last_position(data, params, limit_total)
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                next_pos = data.get("nextRecordPosition")
+                upcoming = None
+                if next_pos and (last is None or int(next_pos) <= last):
+                    upcoming = pool.submit(self._get_json, endpoint, self._page_params(params, next_pos, stop))
 
-        Returned keys:
-          - endpoint, params
-          - numberOfRecords (API) + totalRecords (alias)
-          - retrievedRecords
-          - pages
-          - records: list[dict] (aggregated across pages)
-          - truncated: bool
+                yield data
 
-        Note: The official API uses `numberOfRecords` (not `totalRecords`).
-        """
-        self.check_required_any_condition(params)
-        limit_total = self.sanitize_limit(limit_total)
+                if upcoming is None:
+                    return
+                data = upcoming.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
 
-        # Work on a copy so caller's dict isn't mutated
-        cur_params = dict(params)
+    def _iter_page_records(
+            self,
+            *,
+            endpoint: str,
+            record_key: str,
+            params: Dict[str, Any],
+            limit_total: Optional[int],
+    ) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """Yield ``(page, records)`` pairs until ``limit_total`` or the result set is exhausted.
+
+        ``records`` are the page's records normalized to dicts and cut at ``limit_total``.
+        Expects already validated params and a sanitized limit.
+        """
+        # Cleaned once here; only startRecord changes from page to page.
+        cur_params = self._prepare_params(params)
 
         # Provide safe defaults (API requires these for paging).
         cur_params.setdefault("maximumRecords", 100)
         cur_params.setdefault("startRecord", 1)
 
-        all_records: List[Dict[str, Any]] = []
-        pages = 0
-
-        first_meta: Dict[str, Any] | None = None
+        retrieved = 0
         number_of_records: Optional[int] = None
 
-        while True:
-            pages += 1
-            data = self._request_json(endpoint, cur_params)
-
-            if first_meta is None:
-                # Preserve the first page metadata for convenience.
-                first_meta = {k: v for k, v in data.items() if k != record_key}
-
+        for data in self._iter_pages(endpoint, cur_params, limit_total):
             if number_of_records is None:
                 try:
                     number_of_records = int(data.get("numberOfRecords", 0))
@@ -220,49 +548,170 @@ class _DietCore:
             if not isinstance(raw_records, list):
                 raise DietSearchRequestError(f"Unexpected '{record_key}' shape: {type(raw_records)}")
 
-            for rec in raw_records:
-                if isinstance(rec, dict):
-                    all_records.append(rec)
-                else:
-                    all_records.append({"value": rec})
-
-                if limit_total is not None and len(all_records) >= limit_total:
-                    all_records = all_records[:limit_total]
-                    meta = first_meta or {}
-                    return {
-                        "endpoint": endpoint,
-                        "params": params,
-                        **meta,
-                        "numberOfRecords": number_of_records,
-                        "totalRecords": number_of_records,  # alias (convenience)
-                        "retrievedRecords": len(all_records),
-                        "pages": pages,
-                        "records": all_records,
-                        "truncated": True,
-                    }
-
-            next_pos = data.get("nextRecordPosition")
-            if not next_pos:
-                break
+            # Only look at the records still needed from this page.
+            if limit_total is not None:
+                raw_records = raw_records[: limit_total - retrieved]
+
+            records: List[Dict[str, Any]] = [
+                rec if isinstance(rec, dict) else {"value": rec} for rec in raw_records
+            ]
+
+            retrieved += len(records)
+            yield data, records
+
+            if limit_total is not None and retrieved >= limit_total:
+                return
+
+            # An empty page means the result set is exhausted, whatever nextRecordPosition says.
+            if not records:
+                return
 
             # When there's no explicit user limit, stop once we collected all available records.
-            if limit_total is None and number_of_records is not None and len(all_records) >= number_of_records:
-                break
+            if limit_total is None and number_of_records is not None and retrieved >= number_of_records:
+                return
+
+    def search_records_iter(
+            self,
+            *,
+            endpoint: str,
+            record_key: str,
+            params: Dict[str, Any],
+            limit_total: Optional[int] = None,
+            validated: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield records one at a time across pages, without aggregating them.
+
+        Pages are requested lazily as the iterator is consumed; besides the current page,
+        only the prefetched ones are held in memory (at most ``2 * max_workers``).
+        """
+        if not validated:
+            self.check_required_any_condition(params)
+        limit_total = self.sanitize_limit(limit_total)
+
+        pages = self.search_pages_iter(
+            endpoint=endpoint, record_key=record_key, params=params, limit_total=limit_total, validated=True
+        )
+        return (rec for records in pages for rec in records)
+
+    def search_pages_iter(
+            self,
+            *,
+            endpoint: str,
+            record_key: str,
+            params: Dict[str, Any],
+            limit_total: Optional[int] = None,
+            validated: bool = False,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield each page's records as a list, cut at ``limit_total``; pages are fetched lazily.
+
+        Closing the iterator early stops fetching and shuts down any prefetch workers.
+        """
+        if not validated:
+            self.check_required_any_condition(params)
+        limit_total = self.sanitize_limit(limit_total)
+
+        pages = self._iter_page_records(
+            endpoint=endpoint, record_key=record_key, params=params, limit_total=limit_total
+        )
+        return (records for _, records in pages)
+
+    def iter_search_result(
+            self,
+            *,
+            endpoint: str,
+            record_key: str,
+            params: Dict[str, Any],
+            limit_total: Optional[int] = None,
+            validated: bool = False,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Yield the ``search_records`` result as ``(key, value)`` pairs, for streaming writers.
 
-            cur_params["startRecord"] = next_pos
+        The value for ``"records"`` is a lazy iterator over the records; the counters
+        that follow it (``retrievedRecords``, ``pages``, ``truncated``) are only yielded
+        once that iterator has been consumed.
+        """
+        if not validated:
+            self.check_required_any_condition(params)
+        limit_total = self.sanitize_limit(limit_total)
 
-            if self.sleep_seconds:
-                time.sleep(self.sleep_seconds)
+        pages = self._iter_page_records(
+            endpoint=endpoint, record_key=record_key, params=params, limit_total=limit_total
+        )
+        first = next(pages, None)
 
-        meta = first_meta or {}
-        return {
+        # Preserve the first page metadata for convenience.
+        meta = {k: v for k, v in first[0].items() if k != record_key} if first else {}
+        number_of_records: Optional[int] = None
+        if first is not None:
+            try:
+                number_of_records = int(first[0].get("numberOfRecords", 0))
+            except Exception:
+                number_of_records = None
+
+        head = {
             "endpoint": endpoint,
             "params": params,
             **meta,
             "numberOfRecords": number_of_records,
             "totalRecords": number_of_records,  # alias (convenience)
-            "retrievedRecords": len(all_records),
-            "pages": pages,
-            "records": all_records,
-            "truncated": False,
         }
+        yield from head.items()
+
+        counts = {"pages": 0, "retrieved": 0}
+
+        def _records() -> Iterator[Dict[str, Any]]:
+            if first is None:
+                return
+            for _, records in itertools.chain([first], pages):
+                counts["pages"] += 1
+                counts["retrieved"] += len(records)
+                yield from records
+
+        yield "records", _records()
+        yield "retrievedRecords", counts["retrieved"]
+        yield "pages", counts["pages"]
+        yield "truncated", limit_total is not None and counts["retrieved"] >= limit_total
+
+    def search_records(
+            self,
+            *,
+            endpoint: str,
+            record_key: str,
+            params: Dict[str, Any],
+            limit_total: Optional[int] = None,
+            validated: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch pages and aggregate records.
+
+        This method returns an aggregated structure intended for *human / script* use,
+        while still preserving key fields from the Diet Search API response.
+
+        Returned keys:
+          - endpoint, params
+          - numberOfRecords (API) + totalRecords (alias)
+          - retrievedRecords
+          - pages
+          - records: list[dict] (aggregated across pages)
+          - truncated: bool
+
+        Note: The official API uses `numberOfRecords` (not `totalRecords`).
+
+        Pass ``validated=True`` when ``params`` come from a query model, whose own
+        validation already requires a search condition; the check is then skipped here.
+        """
+        result: Dict[str, Any] = {}
+        for key, value in self.iter_search_result(
+                endpoint=endpoint,
+                record_key=record_key,
+                params=params,
+                limit_total=limit_total,
+                validated=validated,
+        ):
+            result[key] = list(value) if key == "records" else value
+
+        # Keep the established key order: counters first, then records.
+        records = result.pop("records")
+        truncated = result.pop("truncated")
+        result["records"] = records
+        result["truncated"] = truncated
+        return result
@@ -1,18 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .core import _DietCore
 from .queries import MeetingListQuery, MeetingQuery, SpeechQuery
 
+# Query models already require a search condition, so the core's own check is skipped (validated=True).
+
 
 class MeetingListEndpoint:
     def __init__(self, core: _DietCore) -> None:
         self._core = core
+        self._endpoint = f"{core.base_url}/meeting_list"
 
     def search(self, query: MeetingListQuery, *, limit_total: Optional[int] = None) -> Dict[str, Any]:
-        endpoint = f"{self._core.base_url}/meeting_list"
-        return self._core.search_records(endpoint=endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total)
+        return self._core.search_records(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def search_items(self, query: MeetingListQuery, *, limit_total: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Like ``search()``, but yield the result as ``(key, value)`` pairs with ``"records"`` as a lazy iterator."""
+        return self._core.iter_search_result(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def count(self, query: MeetingListQuery) -> int:
+        return self._core.count(endpoint=self._endpoint, params=query.to_params(), validated=True)
+
+    def search_iter(self, query: MeetingListQuery, *, limit_total: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        return self._core.search_records_iter(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def search_pages(self, query: MeetingListQuery, *, limit_total: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        return self._core.search_pages_iter(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
 
     def search_any(self, text: str, *, maximum_records: int = 100, limit_total: Optional[int] = None) -> Dict[str, Any]:
         q = MeetingListQuery(any=text, maximum_records=maximum_records)
@@ -22,10 +37,23 @@ class MeetingListEndpoint:
 class MeetingEndpoint:
     def __init__(self, core: _DietCore) -> None:
         self._core = core
+        self._endpoint = f"{core.base_url}/meeting"
 
     def search(self, query: MeetingQuery, *, limit_total: Optional[int] = None) -> Dict[str, Any]:
-        endpoint = f"{self._core.base_url}/meeting"
-        return self._core.search_records(endpoint=endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total)
+        return self._core.search_records(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def search_items(self, query: MeetingQuery, *, limit_total: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Like ``search()``, but yield the result as ``(key, value)`` pairs with ``"records"`` as a lazy iterator."""
+        return self._core.iter_search_result(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def count(self, query: MeetingQuery) -> int:
+        return self._core.count(endpoint=self._endpoint, params=query.to_params(), validated=True)
+
+    def search_iter(self, query: MeetingQuery, *, limit_total: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        return self._core.search_records_iter(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def search_pages(self, query: MeetingQuery, *, limit_total: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        return self._core.search_pages_iter(endpoint=self._endpoint, record_key="meetingRecord", params=query.to_params(), limit_total=limit_total, validated=True)
 
     def search_any(self, text: str, *, maximum_records: int = 10, limit_total: Optional[int] = None) -> Dict[str, Any]:
         q = MeetingQuery(any=text, maximum_records=maximum_records)
@@ -35,10 +63,23 @@ class MeetingEndpoint:
 class SpeechEndpoint:
     def __init__(self, core: _DietCore) -> None:
         self._core = core
+        self._endpoint = f"{core.base_url}/speech"
 
     def search(self, query: SpeechQuery, *, limit_total: Optional[int] = None) -> Dict[str, Any]:
-        endpoint = f"{self._core.base_url}/speech"
-        return self._core.search_records(endpoint=endpoint, record_key="speechRecord", params=query.to_params(), limit_total=limit_total)
+        return self._core.search_records(endpoint=self._endpoint, record_key="speechRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def search_items(self, query: SpeechQuery, *, limit_total: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        """Like ``search()``, but yield the result as ``(key, value)`` pairs with ``"records"`` as a lazy iterator."""
+        return self._core.iter_search_result(endpoint=self._endpoint, record_key="speechRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def count(self, query: SpeechQuery) -> int:
+        return self._core.count(endpoint=self._endpoint, params=query.to_params(), validated=True)
+
+    def search_iter(self, query: SpeechQuery, *, limit_total: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        return self._core.search_records_iter(endpoint=self._endpoint, record_key="speechRecord", params=query.to_params(), limit_total=limit_total, validated=True)
+
+    def search_pages(self, query: SpeechQuery, *, limit_total: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+        return self._core.search_pages_iter(endpoint=self._endpoint, record_key="speechRecord", params=query.to_params(), limit_total=limit_total, validated=True)
 
     def search_any(self, text: str, *, maximum_records: int = 100, limit_total: Optional[int] = None) -> Dict[str, Any]:
         q = SpeechQuery(any=text, maximum_records=maximum_records)
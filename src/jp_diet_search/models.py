@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from typing import List, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional, Type, Union
+from pydantic import BaseModel, Field, TypeAdapter
 
 # Allow the API to return strings or integers for some fields
 NumberLike = Union[int, str]
@@ -65,6 +65,16 @@ class MeetingRecord(BaseModel):
     pdf_url: Optional[str] = Field(default=None, alias="pdfURL")
 
 
+def api_field_names(model: Type[BaseModel]) -> List[str]:
+    """API (alias) names of a record model's fields, in declaration order."""
+    return [field.alias or name for name, field in model.model_fields.items()]
+
+
+# Validate a whole page of records in one call into pydantic-core instead of one call per record.
+_MEETING_LIST_ADAPTER = TypeAdapter(List[MeetingRecord])
+_SPEECH_LIST_ADAPTER = TypeAdapter(List[SpeechRecord])
+
+
 class MeetingListResult(BaseModel):
     """Aggregated result for /meeting_list and /meeting."""
 
@@ -72,6 +82,14 @@ class MeetingListResult(BaseModel):
     number_of_records: int
     records: List[MeetingRecord]
 
+    @classmethod
+    def from_search(cls, result: Dict[str, Any]) -> "MeetingListResult":
+        """Build from the dict returned by ``client.meeting_list.search()`` or ``client.meeting.search()``."""
+        return cls(
+            number_of_records=result.get("numberOfRecords") or 0,
+            records=_MEETING_LIST_ADAPTER.validate_python(result.get("records", [])),
+        )
+
 
 class SpeechSearchResult(BaseModel):
     """Aggregated result for /speech."""
@@ -80,3 +98,11 @@ class SpeechSearchResult(BaseModel):
     number_of_records: int
     records: List[SpeechRecord]
 
+    @classmethod
+    def from_search(cls, result: Dict[str, Any]) -> "SpeechSearchResult":
+        """Build from the dict returned by ``client.speech.search()``."""
+        return cls(
+            number_of_records=result.get("numberOfRecords") or 0,
+            records=_SPEECH_LIST_ADAPTER.validate_python(result.get("records", [])),
+        )
+
@@ -6,6 +6,26 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 
 RecordPacking = Literal["json", "xml"]
 
+# Fields that count as a search condition (at least one must be set).
+_CONDITION_FIELDS = (
+    "name_of_house",
+    "name_of_meeting",
+    "any",
+    "speaker",
+    "from_date",
+    "until_date",
+    "speech_number",
+    "speaker_position",
+    "speaker_group",
+    "speaker_role",
+    "speech_id",
+    "issue_id",
+    "session_from",
+    "session_to",
+    "issue_from",
+    "issue_to",
+)
+
 
 class BaseQuery(BaseModel):
     """
@@ -15,92 +35,48 @@ class BaseQuery(BaseModel):
     """
     model_config = ConfigDict(populate_by_name=True, extra="forbid")
 
-    # common paging
-    start_record: Optional[int] = Field(default=None, ge=1)
-    maximum_records: Optional[int] = Field(default=None, ge=1)
-    record_packing: Optional[RecordPacking] = "json"
+    # common paging (aliases are the Diet Search API parameter names)
+    start_record: Optional[int] = Field(default=None, ge=1, alias="startRecord")
+    maximum_records: Optional[int] = Field(default=None, ge=1, alias="maximumRecords")
+    record_packing: Optional[RecordPacking] = Field(default="json", alias="recordPacking")
 
     # common search conditions (snake_case)
-    name_of_house: Optional[str] = None
-    name_of_meeting: Optional[str] = None
+    name_of_house: Optional[str] = Field(default=None, alias="nameOfHouse")
+    name_of_meeting: Optional[str] = Field(default=None, alias="nameOfMeeting")
     any: Optional[str] = None
     speaker: Optional[str] = None
     from_date: Optional[str] = Field(default=None, alias="from")   # allow `from=` in dicts
     until_date: Optional[str] = Field(default=None, alias="until") # allow `until=` in dicts
 
     # misc flags / range
-    supplement_and_appendix: Optional[bool] = None
-    contents_and_index: Optional[bool] = None
-    search_range: Optional[str] = None
+    supplement_and_appendix: Optional[bool] = Field(default=None, alias="supplementAndAppendix")
+    contents_and_index: Optional[bool] = Field(default=None, alias="contentsAndIndex")
+    search_range: Optional[str] = Field(default=None, alias="searchRange")
     closing: Optional[bool] = None
 
     # speech / meeting fields
-    speech_number: Optional[int] = None
-    speaker_position: Optional[str] = None
-    speaker_group: Optional[str] = None
-    speaker_role: Optional[str] = None
-    speech_id: Optional[str] = None
-    issue_id: Optional[str] = None
-    session_from: Optional[int] = None
-    session_to: Optional[int] = None
-    issue_from: Optional[int] = None
-    issue_to: Optional[int] = None
+    speech_number: Optional[int] = Field(default=None, alias="speechNumber")
+    speaker_position: Optional[str] = Field(default=None, alias="speakerPosition")
+    speaker_group: Optional[str] = Field(default=None, alias="speakerGroup")
+    speaker_role: Optional[str] = Field(default=None, alias="speakerRole")
+    speech_id: Optional[str] = Field(default=None, alias="speechID")
+    issue_id: Optional[str] = Field(default=None, alias="issueID")
+    session_from: Optional[int] = Field(default=None, alias="sessionFrom")
+    session_to: Optional[int] = Field(default=None, alias="sessionTo")
+    issue_from: Optional[int] = Field(default=None, alias="issueFrom")
+    issue_to: Optional[int] = Field(default=None, alias="issueTo")
 
     def to_params(self) -> Dict[str, Any]:
         """
         Convert this query to Diet Search API parameter dict.
+
+        Every field carries its API name as alias, so the alias dump is the parameter dict.
         """
-        data = self.model_dump(by_alias=True, exclude_none=True)
-
-        mapping = {
-            "start_record": "startRecord",
-            "maximum_records": "maximumRecords",
-            "record_packing": "recordPacking",
-            "name_of_house": "nameOfHouse",
-            "name_of_meeting": "nameOfMeeting",
-            "supplement_and_appendix": "supplementAndAppendix",
-            "contents_and_index": "contentsAndIndex",
-            "search_range": "searchRange",
-            "speech_number": "speechNumber",
-            "speaker_position": "speakerPosition",
-            "speaker_group": "speakerGroup",
-            "speaker_role": "speakerRole",
-            "speech_id": "speechID",
-            "issue_id": "issueID",
-            "session_from": "sessionFrom",
-            "session_to": "sessionTo",
-            "issue_from": "issueFrom",
-            "issue_to": "issueTo",
-            "from_date": "from",
-            "until_date": "until",
-        }
-
-        out: Dict[str, Any] = {}
-        for k, v in data.items():
-            out[mapping.get(k, k)] = v
-        return out
+        return self.model_dump(by_alias=True, exclude_none=True)
 
     @model_validator(mode="after")
     def require_some_condition(self):
-        keys = [
-            "name_of_house",
-            "name_of_meeting",
-            "any",
-            "speaker",
-            "from_date",
-            "until_date",
-            "speech_number",
-            "speaker_position",
-            "speaker_group",
-            "speaker_role",
-            "speech_id",
-            "issue_id",
-            "session_from",
-            "session_to",
-            "issue_from",
-            "issue_to",
-        ]
-        if not any(getattr(self, k) not in (None, "") for k in keys):
+        if not any(getattr(self, k) not in (None, "") for k in _CONDITION_FIELDS):
             raise ValueError("At least one search condition is required.")
         return self
 
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from jp_diet_search import AsyncDietClient
+from jp_diet_search.core import _DietCore
+from jp_diet_search.queries import MeetingListQuery, MeetingQuery, SpeechQuery
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    calls = []
+
+    def _get_json(self, endpoint, params):
+        calls.append((endpoint.rsplit("/", 1)[-1], dict(params)))
+        start = int(params.get("startRecord", 1))
+        stop = min(start + int(params["maximumRecords"]) - 1, 5)
+        key = "speechRecord" if endpoint.endswith("/speech") else "meetingRecord"
+        return {
+            "numberOfRecords": 5,
+            "nextRecordPosition": stop + 1 if stop < 5 else None,
+            key: [{"id": i} for i in range(start, stop + 1)],
+        }
+
+    monkeypatch.setattr(_DietCore, "_get_json", _get_json)
+    return calls
+
+
+def test_async_endpoints_can_be_gathered(fake_api):
+    client = AsyncDietClient()
+
+    async def run():
+        return await asyncio.gather(
+            client.speech.search(SpeechQuery(any="x", maximum_records=2)),
+            client.meeting_list.search(MeetingListQuery(any="x", maximum_records=2), limit_total=3),
+            client.speech.count(SpeechQuery(any="x")),
+        )
+
+    speeches, meetings, count = asyncio.run(run())
+
+    assert [r["id"] for r in speeches["records"]] == [1, 2, 3, 4, 5]
+    assert [r["id"] for r in meetings["records"]] == [1, 2, 3]
+    assert count == 5
+
+
+def test_async_search_iter_streams_records(fake_api):
+    client = AsyncDietClient()
+
+    async def run():
+        return [r["id"] async for r in client.speech.search_iter(SpeechQuery(any="x", maximum_records=2))]
+
+    assert asyncio.run(run()) == [1, 2, 3, 4, 5]
+
+
+def test_async_search_iter_yields_each_page_as_it_arrives(fake_api):
+    client = AsyncDietClient()
+
+    async def run():
+        records = client.meeting.search_iter(MeetingQuery(any="x", maximum_records=1))
+        first = await records.__anext__()
+        calls_at_first = len(fake_api)
+        await records.aclose()
+        await asyncio.sleep(0.05)
+        return first, calls_at_first
+
+    first, calls_at_first = asyncio.run(run())
+
+    assert first == {"id": 1}
+    # page 1 plus at most the prefetched page 2
+    assert calls_at_first <= 2
+    # closing the iterator stopped the search
+    assert len(fake_api) <= 2
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import contextlib
+import csv
+import io
+import json
+
+import pytest
+
+from jp_diet_search import cli
+from jp_diet_search.core import _DietCore
+from jp_diet_search.exceptions import DietSearchRateLimitError, DietSearchRequestError
+from jp_diet_search.queries import SpeechQuery
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    calls = []
+
+    def _get_json(self, endpoint, params):
+        calls.append(dict(params))
+        start = int(params.get("startRecord", 1))
+        size = int(params["maximumRecords"])
+        stop = min(start + size - 1, 7)
+        return {
+            "numberOfRecords": 7,
+            "startRecord": start,
+            "nextRecordPosition": stop + 1 if stop < 7 else None,
+            "speechRecord": [{"speechID": f"s{i}", "speaker": "議員"} for i in range(start, stop + 1)],
+        }
+
+    monkeypatch.setattr(_DietCore, "_get_json", _get_json)
+    return calls
+
+
+def _run(capsysbinary, *argv: str) -> bytes:
+    assert cli.main(["speech", "--any", "x", "--sleep-seconds", "0", "--maximum-records", "3", *argv]) == 0
+    return capsysbinary.readouterr().out
+
+
+def test_cli_json_output(fake_api, capsysbinary):
+    out = json.loads(_run(capsysbinary, "--limit-total", "4"))
+
+    assert out["retrievedRecords"] == 4
+    assert out["truncated"] is True
+    assert [r["speechID"] for r in out["records"]] == ["s1", "s2", "s3", "s4"]
+
+
+def test_cli_jsonl_output(fake_api, capsysbinary):
+    out = _run(capsysbinary, "--format", "jsonl", "--no-ascii")
+
+    lines = out.decode("utf-8").splitlines()
+    assert [json.loads(line)["speechID"] for line in lines] == [f"s{i}" for i in range(1, 8)]
+    assert "議員" in lines[0]
+
+
+def test_cli_ascii_escapes_by_default(fake_api, capsysbinary):
+    out = _run(capsysbinary, "--format", "jsonl", "--limit-total", "1")
+
+    assert out == b'{"speechID":"s1","speaker":"\\u8b70\\u54e1"}\n'
+
+
+def test_cli_writes_output_file(fake_api, capsysbinary, tmp_path):
+    target = tmp_path / "out" / "speeches.json"
+    _run(capsysbinary, "--output", str(target), "--no-ascii")
+
+    assert json.loads(target.read_text(encoding="utf-8"))["retrievedRecords"] == 7
+
+
+def test_cli_csv_output_uses_fixed_schema(fake_api, capsysbinary):
+    out = _run(capsysbinary, "--format", "csv", "--limit-total", "2")
+
+    rows = list(csv.reader(io.StringIO(out.decode("utf-8"))))
+    assert rows[0][:2] == ["speechID", "issueID"]
+    assert len(rows) == 3
+    assert all(len(row) == len(rows[0]) for row in rows)
+    assert rows[1][0] == "s1"
+    assert rows[1][rows[0].index("speaker")] == "議員"
+
+
+def test_cli_dry_run_fetches_one_record(fake_api, capsysbinary):
+    out = json.loads(_run(capsysbinary, "--dry-run"))
+
+    assert out == {"numberOfRecords": 7}
+    assert len(fake_api) == 1
+    assert fake_api[0]["maximumRecords"] == 1
+
+
+@pytest.mark.parametrize("indent", ["0", "2", "4"])
+def test_cli_streamed_json_matches_search_result(fake_api, capsysbinary, indent):
+    out = _run(capsysbinary, "--indent", indent, "--limit-total", "5")
+
+    expected = _DietCore(sleep_seconds=0).search_records(
+        endpoint="https://kokkai.ndl.go.jp/api/speech",
+        record_key="speechRecord",
+        params=SpeechQuery(any="x", maximum_records=3).to_params(),
+        limit_total=5,
+    )
+    assert json.loads(out) == expected
+    assert out.endswith(b"\n}\n")
+
+
+def test_cli_max_workers_fetches_all_pages(fake_api, capsysbinary):
+    out = json.loads(_run(capsysbinary, "--max-workers", "3"))
+
+    assert [r["speechID"] for r in out["records"]] == [f"s{i}" for i in range(1, 8)]
+    assert sorted(c["startRecord"] for c in fake_api) == [1, 4, 7]
+
+
+@pytest.mark.parametrize("fmt", ["json", "jsonl", "csv"])
+def test_cli_request_error_writes_no_output(monkeypatch, capsysbinary, tmp_path, fmt):
+    def _get_json(self, endpoint, params):
+        raise DietSearchRequestError("Request failed: connection refused")
+
+    monkeypatch.setattr(_DietCore, "_get_json", _get_json)
+    out_file = tmp_path / "out" / f"result.{fmt}"
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["speech", "--any", "x", "--format", fmt, "--output", str(out_file)])
+    assert exc.value.code == 2
+    assert not out_file.exists()
+
+    with pytest.raises(SystemExit):
+        cli.main(["speech", "--any", "x", "--format", fmt])
+    captured = capsysbinary.readouterr()
+    assert captured.out == b""
+    assert b"connection refused" in captured.err
+
+
+@pytest.mark.parametrize("extra", [[], ["--dry-run"], ["--format", "jsonl"], ["--format", "csv"]])
+def test_cli_writes_to_text_only_stdout(fake_api, extra):
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        rc = cli.main(["speech", "--any", "x", "--sleep-seconds", "0", "--maximum-records", "3", *extra])
+
+    assert rc == 0
+    out = buf.getvalue()
+    if not extra:
+        assert json.loads(out)["records"][0]["speaker"] == "議員"
+    elif extra == ["--dry-run"]:
+        assert json.loads(out) == {"numberOfRecords": 7}
+    elif extra == ["--format", "jsonl"]:
+        assert [json.loads(line)["speaker"] for line in out.splitlines()] == ["議員"] * 7
+    else:
+        rows = list(csv.DictReader(io.StringIO(out)))
+        assert [r["speaker"] for r in rows] == ["議員"] * 7
+
+
+@pytest.mark.parametrize("fmt", ["json", "jsonl", "csv"])
+def test_cli_failure_after_first_page_keeps_existing_output(fake_api, monkeypatch, tmp_path, fmt):
+    serve = _DietCore._get_json
+
+    def _get_json(self, endpoint, params):
+        if int(params.get("startRecord", 1)) > 1:
+            raise DietSearchRateLimitError("Rate limited (429)")
+        return serve(self, endpoint, params)
+
+    monkeypatch.setattr(_DietCore, "_get_json", _get_json)
+    out_file = tmp_path / f"result.{fmt}"
+    out_file.write_text("previous run")
+
+    with pytest.raises(SystemExit):
+        cli.main(["speech", "--any", "x", "--sleep-seconds", "0", "--maximum-records", "3",
+                  "--format", fmt, "--output", str(out_file)])
+
+    assert out_file.read_text() == "previous run"
+    assert list(tmp_path.iterdir()) == [out_file]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+import jp_diet_search.core as core_mod
+from jp_diet_search.core import _DietCore
+from jp_diet_search.exceptions import DietSearchRequestError
+
+ENDPOINT = "https://example/api/speech"
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    core = _DietCore(cache_dir=tmp_path, mem_cache_size=0)
+    params = {"any": "科学技術", "startRecord": 1}
+
+    assert core._load_from_cache(ENDPOINT, params) is None
+    core._save_to_cache(ENDPOINT, params, {"numberOfRecords": 1})
+
+    assert core._load_from_cache(ENDPOINT, params)["body"] == {"numberOfRecords": 1}
+    assert core._load_from_cache(ENDPOINT, {"any": "科学技術", "startRecord": 2}) is None
+
+
+def test_memory_cache_serves_hits_without_disk(tmp_path):
+    core = _DietCore(cache_dir=tmp_path)
+    params = {"any": "x"}
+    core._save_to_cache(ENDPOINT, params, {"numberOfRecords": 1})
+
+    for f in tmp_path.iterdir():
+        f.unlink()
+
+    assert core._load_from_cache(ENDPOINT, params)["body"] == {"numberOfRecords": 1}
+
+
+def test_memory_cache_hits_are_independent_copies(tmp_path):
+    core = _core_with_responses(tmp_path, _response(200, b'{"speechRecord": [{"speechID": "s1"}]}'))
+    params = {"any": "x", "maximumRecords": 10}
+
+    first = core.search_records(endpoint=ENDPOINT, record_key="speechRecord", params=params)
+    first["records"][0]["speechID"] = "changed"
+    again = core.search_records(endpoint=ENDPOINT, record_key="speechRecord", params=params)
+
+    assert core.session.get.call_count == 1
+    assert again["records"] == [{"speechID": "s1"}]
+    assert again["records"][0] is not first["records"][0]
+
+
+def test_memory_cache_evicts_least_recently_used(tmp_path):
+    core = _DietCore(cache_dir=tmp_path, mem_cache_size=2)
+    for i in range(3):
+        core._save_to_cache(ENDPOINT, {"any": "x", "startRecord": i}, {"page": i})
+
+    assert len(core._mem_cache) == 2
+    assert core._cache_key(ENDPOINT, {"any": "x", "startRecord": 0}) not in core._mem_cache
+    # evicted entries are still served from disk, and promoted again
+    assert core._load_from_cache(ENDPOINT, {"any": "x", "startRecord": 0})["body"] == {"page": 0}
+    assert core._cache_key(ENDPOINT, {"any": "x", "startRecord": 0}) in core._mem_cache
+
+
+def test_save_to_cache_replaces_entry_atomically(tmp_path):
+    core = _DietCore(cache_dir=tmp_path, mem_cache_size=0)
+    params = {"any": "x"}
+    core._save_to_cache(ENDPOINT, params, {"v": 1})
+    core._save_to_cache(ENDPOINT, params, {"v": 2})
+
+    assert [f.suffix for f in tmp_path.iterdir()] == [".json"]
+    assert core._load_from_cache(ENDPOINT, params)["body"] == {"v": 2}
+
+
+def test_corrupt_cache_entry_is_a_miss(tmp_path):
+    core = _DietCore(cache_dir=tmp_path, mem_cache_size=0)
+    params = {"any": "x"}
+    (tmp_path / core._cache_key(ENDPOINT, params)).write_bytes(b'{"v": ')
+
+    assert core._load_from_cache(ENDPOINT, params) is None
+
+
+def _response(status_code: int, body: bytes = b"", headers: dict | None = None):
+    return SimpleNamespace(status_code=status_code, text=body.decode(), content=body, headers=headers or {})
+
+
+def _core_with_responses(tmp_path, *responses, **kwargs) -> _DietCore:
+    session = requests.Session()
+    session.get = Mock(side_effect=list(responses))
+    return _DietCore(cache_dir=tmp_path, session=session, **kwargs)
+
+
+def test_fresh_entries_are_served_without_network(tmp_path):
+    core = _core_with_responses(tmp_path, _response(200, b'{"v": 1}'), cache_ttl=60)
+
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 1}
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 1}
+    assert core.session.get.call_count == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(tmp_path, monkeypatch):
+    core = _core_with_responses(
+        tmp_path,
+        _response(200, b'{"v": 1}', {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        _response(304),
+        cache_ttl=60,
+    )
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 1}
+
+    now = time.time()
+    monkeypatch.setattr(core_mod.time, "time", lambda: now + 120)
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 1}
+
+    headers = core.session.get.call_args.kwargs["headers"]
+    assert headers == {"If-None-Match": '"abc"', "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    # the 304 refreshed the entry, so it is fresh again
+    assert core._is_fresh(core._load_from_cache(ENDPOINT, {"any": "x", "recordPacking": "json"}))
+
+
+def test_stale_entry_is_revalidated_with_last_modified_only(tmp_path, monkeypatch):
+    core = _core_with_responses(
+        tmp_path,
+        _response(200, b'{"v": 1}', {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+        _response(304),
+        _response(200, b'{"v": 2}', {"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}),
+        cache_ttl=60,
+        mem_cache_size=0,
+    )
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 1}
+
+    now = time.time()
+    monkeypatch.setattr(core_mod.time, "time", lambda: now + 120)
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 1}
+    assert core.session.get.call_args.kwargs["headers"] == {"If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    # a changed resource comes back as 200 and replaces the entry and its validator
+    monkeypatch.setattr(core_mod.time, "time", lambda: now + 240)
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 2}
+    entry = core._load_from_cache(ENDPOINT, {"any": "x", "recordPacking": "json"})
+    assert entry["body"] == {"v": 2}
+    assert entry["_meta"]["last_modified"] == "Tue, 02 Jan 2024 00:00:00 GMT"
+
+
+def test_stale_entry_without_validators_is_refetched(tmp_path, monkeypatch):
+    core = _core_with_responses(tmp_path, _response(200, b'{"v": 1}'), _response(200, b'{"v": 2}'), cache_ttl=60)
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 1}
+
+    now = time.time()
+    monkeypatch.setattr(core_mod.time, "time", lambda: now + 120)
+    assert core._request_json(ENDPOINT, {"any": "x"}) == {"v": 2}
+    assert core.session.get.call_args.kwargs["headers"] is None
+
+
+def test_cache_full_false_keeps_only_model_fields(tmp_path):
+    body = b'{"numberOfRecords": 1, "meetingRecord": [{"issueID": "m1", "extra": "x", "speechRecord": [{"speechID": "s1", "junk": 1}]}]}'
+    core = _core_with_responses(tmp_path, _response(200, body), cache_full=False)
+
+    data = core._request_json(ENDPOINT, {"any": "x"})
+
+    assert data == {"numberOfRecords": 1, "meetingRecord": [{"issueID": "m1", "speechRecord": [{"speechID": "s1"}]}]}
+    assert core._load_from_cache(ENDPOINT, {"any": "x", "recordPacking": "json"})["body"] == data
+
+
+def test_cache_key_is_order_independent_and_unambiguous():
+    core = _DietCore()
+
+    assert core._cache_key(ENDPOINT, {"any": "x", "speaker": "y"}) == core._cache_key(ENDPOINT, {"speaker": "y", "any": "x"})
+    assert core._cache_key(ENDPOINT, {"any": "x&speaker=y"}) != core._cache_key(ENDPOINT, {"any": "x", "speaker": "y"})
+    assert core._cache_key(ENDPOINT, {"any": "x"}) != core._cache_key(ENDPOINT + "_list", {"any": "x"})
+
+
+def test_prune_cache_removes_only_old_entries(tmp_path):
+    core = _DietCore(cache_dir=tmp_path, cache_ttl=60)
+    core._save_to_cache(ENDPOINT, {"any": "old"}, {"v": 1})
+    core._save_to_cache(ENDPOINT, {"any": "new"}, {"v": 2})
+    old_file = tmp_path / core._cache_key(ENDPOINT, {"any": "old"})
+    past = time.time() - 120
+    core_mod.os.utime(old_file, (past, past))
+    (tmp_path / "notes.json").write_text("{}")
+
+    assert core.prune_cache() == 1
+    assert not old_file.exists()
+    assert (tmp_path / "notes.json").exists()
+    assert core._load_from_cache(ENDPOINT, {"any": "old"}) is None
+    assert core._load_from_cache(ENDPOINT, {"any": "new"})["body"] == {"v": 2}
+
+
+def test_prune_cache_spares_in_flight_writes_and_foreign_files(tmp_path):
+    core = _DietCore(cache_dir=tmp_path, cache_ttl=60)
+    key = core._cache_key(ENDPOINT, {"any": "x"})
+    in_flight = tmp_path / f"{key}.123.456.tmp"
+    abandoned = tmp_path / f"{key}.123.789.tmp"
+    foreign = tmp_path / ("z" * 32 + ".json")
+    for f in (in_flight, abandoned, foreign):
+        f.write_bytes(b"{}")
+    past = time.time() - 120
+    for f in (abandoned, foreign):
+        core_mod.os.utime(f, (past, past))
+
+    assert core.prune_cache() == 1
+    assert not abandoned.exists()
+    assert in_flight.exists()
+    assert foreign.exists()
+
+
+def test_prune_cache_needs_an_age(tmp_path):
+    with pytest.raises(DietSearchRequestError):
+        _DietCore(cache_dir=tmp_path).prune_cache()
+
+
+def test_concurrent_writers_do_not_share_temp_files(tmp_path):
+    core = _DietCore(cache_dir=tmp_path, mem_cache_size=0)
+    params = {"any": "x"}
+
+    def write(i):
+        for _ in range(20):
+            core._save_to_cache(ENDPOINT, params, {"v": i})
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert [f.suffix for f in tmp_path.iterdir()] == [".json"]
+    assert core._load_from_cache(ENDPOINT, params)["body"]["v"] in range(4)
+
+
+def test_trimmed_and_full_entries_do_not_mix_in_a_shared_cache_dir(tmp_path):
+    body = b'{"numberOfRecords": 1, "speechRecord": [{"speechID": "s1", "extra": "x"}]}'
+    trimmed = _core_with_responses(tmp_path, _response(200, body), cache_full=False)
+    full = _core_with_responses(tmp_path, _response(200, body))
+
+    assert trimmed._request_json(ENDPOINT, {"any": "x"})["speechRecord"] == [{"speechID": "s1"}]
+    assert full._request_json(ENDPOINT, {"any": "x"})["speechRecord"] == [{"speechID": "s1", "extra": "x"}]
+    assert full.session.get.call_count == 1
+    assert len(list(tmp_path.iterdir())) == 2
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from jp_diet_search.core import _DietCore
+from jp_diet_search.exceptions import DietSearchAPIError, DietSearchRequestError
+
+
+class FakeAPI:
+    """Serve `total` speech records in pages, like the Diet Search API does."""
+
+    def __init__(self, total: int, cap: int | None = None):
+        self.total = total
+        self.cap = cap  # server-side page size limit, below what clients may ask for
+        self.calls: list[dict] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, endpoint: str, params: dict) -> dict:
+        with self._lock:
+            self.calls.append(dict(params))
+        start = int(params["startRecord"])
+        size = int(params["maximumRecords"])
+        if self.cap is not None:
+            size = min(size, self.cap)
+        stop = min(start + size - 1, self.total)
+        records = [{"speechID": f"s{i}"} for i in range(start, stop + 1)]
+        return {
+            "numberOfRecords": self.total,
+            "numberOfReturn": len(records),
+            "startRecord": start,
+            "nextRecordPosition": stop + 1 if stop < self.total else None,
+            "speechRecord": records,
+        }
+
+
+def _make_core(api: FakeAPI, **kwargs) -> _DietCore:
+    core = _DietCore(**kwargs)
+    core._get_json = api
+    return core
+
+
+def _search(core: _DietCore, **kwargs) -> dict:
+    return core.search_records(
+        endpoint="https://example/api/speech",
+        record_key="speechRecord",
+        params={"any": "x", "maximumRecords": 10},
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_search_records_collects_all_pages(max_workers):
+    api = FakeAPI(total=35)
+    res = _search(_make_core(api, max_workers=max_workers))
+
+    assert res["pages"] == 4
+    assert res["truncated"] is False
+    assert [r["speechID"] for r in res["records"]] == [f"s{i}" for i in range(1, 36)]
+    assert sorted(c["startRecord"] for c in api.calls) == [1, 11, 21, 31]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_pages_capped_by_the_server_are_not_skipped(max_workers):
+    api = FakeAPI(total=60, cap=10)
+    res = _make_core(api, max_workers=max_workers).search_records(
+        endpoint="https://example/api/meeting",
+        record_key="speechRecord",
+        params={"any": "x", "maximumRecords": 30},
+    )
+
+    assert [r["speechID"] for r in res["records"]] == [f"s{i}" for i in range(1, 61)]
+    assert res["truncated"] is False
+    assert sorted(c["startRecord"] for c in api.calls) == [1, 11, 21, 31, 41, 51]
+
+
+def test_concurrent_fetch_stays_a_bounded_window_ahead():
+    api = FakeAPI(total=10_000)
+    it = _make_core(api, max_workers=4).search_records_iter(
+        endpoint="https://example/api/speech",
+        record_key="speechRecord",
+        params={"any": "x", "maximumRecords": 10},
+    )
+
+    for _ in range(15):
+        next(it)
+    # the first page plus at most 2 * max_workers pages ahead (one more after a page is consumed)
+    assert len(api.calls) <= 1 + 1 + 2 * 4
+
+    assert sum(1 for _ in it) == 10_000 - 15
+    assert len(api.calls) == 1000
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_search_records_stops_at_limit_total(max_workers):
+    api = FakeAPI(total=100)
+    res = _search(_make_core(api, max_workers=max_workers), limit_total=25)
+
+    assert res["truncated"] is True
+    assert res["retrievedRecords"] == 25
+    assert [r["speechID"] for r in res["records"]] == [f"s{i}" for i in range(1, 26)]
+    assert sorted(c["startRecord"] for c in api.calls) == [1, 11, 21]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_last_page_only_requests_the_records_still_needed(max_workers):
+    api = FakeAPI(total=100)
+    _search(_make_core(api, max_workers=max_workers), limit_total=25)
+
+    sizes = {c["startRecord"]: c["maximumRecords"] for c in api.calls}
+    assert sizes == {1: 10, 11: 10, 21: 5}
+
+
+def test_small_limit_total_shrinks_the_first_page():
+    api = FakeAPI(total=100)
+    res = _search(_make_core(api), limit_total=3)
+
+    assert [r["speechID"] for r in res["records"]] == ["s1", "s2", "s3"]
+    assert [(c["startRecord"], c["maximumRecords"]) for c in api.calls] == [(1, 3)]
+
+
+def test_serial_prefetch_does_not_fetch_past_limit_total():
+    api = FakeAPI(total=100)
+    res = _search(_make_core(api), limit_total=20)
+
+    assert res["retrievedRecords"] == 20
+    assert [c["startRecord"] for c in api.calls] == [1, 11]
+
+
+def test_max_workers_must_be_positive():
+    with pytest.raises(DietSearchRequestError):
+        _DietCore(max_workers=0)
+
+
+def test_search_records_iter_fetches_pages_lazily():
+    api = FakeAPI(total=35)
+    it = _make_core(api).search_records_iter(
+        endpoint="https://example/api/speech",
+        record_key="speechRecord",
+        params={"any": "x", "maximumRecords": 10},
+    )
+
+    assert api.calls == []
+    first = [next(it) for _ in range(10)]
+    assert [r["speechID"] for r in first] == [f"s{i}" for i in range(1, 11)]
+    # at most the current page plus the prefetched next one
+    assert len(api.calls) <= 2
+
+    rest = list(it)
+    assert [r["speechID"] for r in rest] == [f"s{i}" for i in range(11, 36)]
+    assert len(api.calls) == 4
+
+
+def test_search_records_stops_on_empty_page():
+    def api(endpoint, params):
+        return {"numberOfRecords": None, "nextRecordPosition": 99, "speechRecord": []}
+
+    res = _search(_make_core(api))
+
+    assert res["pages"] == 1
+    assert res["records"] == []
+
+
+def test_validated_params_skip_the_condition_check():
+    api = FakeAPI(total=3)
+    core = _make_core(api)
+    kwargs = dict(endpoint="https://example/api/speech", record_key="speechRecord", params={"maximumRecords": 10})
+
+    with pytest.raises(DietSearchAPIError):
+        core.search_records(**kwargs)
+    assert api.calls == []
+
+    assert core.search_records(**kwargs, validated=True)["retrievedRecords"] == 3
@@ -27,6 +27,7 @@ def _make_core_with_session(core_cls, session: requests.Session):
     core = core_cls.__new__(core_cls)
     core.session = session
     core.timeout = 30
+    core.sleep_seconds = 0
 
     # disable cache
     core._load_from_cache = Mock(return_value=None)
@@ -34,10 +35,12 @@ def _make_core_with_session(core_cls, session: requests.Session):
     return core
 
 
-def _fake_response(*, status_code: int, text: str = "", json_obj=None, json_raises: Exception | None = None):
+def _fake_response(*, status_code: int, text: str = "", content: bytes | None = None, json_obj=None, json_raises: Exception | None = None):
     r = SimpleNamespace()
     r.status_code = status_code
     r.text = text
+    r.content = text.encode("utf-8") if content is None else content
+    r.headers = {}
 
     def _json():
         if json_raises is not None:
@@ -81,12 +84,14 @@ def test_request_json_raises_api_error_on_non_200_non_429():
         core._request_json("https://example/api", {"any": "x"})
 
 
-def test_request_json_raises_parse_error_on_bad_json():
+@pytest.mark.parametrize("content", [b'{"not": json}', b"", b'{"x": "\xff"}'])
+def test_request_json_raises_parse_error_on_bad_json(content):
     core_cls = _find_core_class_with_request_json()
     session = Mock(spec=requests.Session)
     session.get.return_value = _fake_response(
         status_code=200,
         text='{"not": "json"}',
+        content=content,
         json_raises=ValueError("invalid json"),
     )
 
@@ -94,3 +99,59 @@ def test_request_json_raises_parse_error_on_bad_json():
 
     with pytest.raises(DietSearchParseError):
         core._request_json("https://example/api", {"any": "x"})
+
+
+def test_request_json_spaces_network_calls_but_not_cache_hits(monkeypatch):
+    slept = []
+    clock = [100.0]
+    monkeypatch.setattr(core_mod.time, "sleep", lambda s: (slept.append(s), clock.__setitem__(0, clock[0] + s)))
+    monkeypatch.setattr(core_mod.time, "monotonic", lambda: clock[0])
+
+    session = requests.Session()
+    session.get = Mock(return_value=_fake_response(status_code=200, text='{"numberOfRecords": 0}'))
+    core = core_mod._DietCore(session=session, sleep_seconds=2.0)
+
+    core._request_json("https://example/api", {"any": "x", "startRecord": 1})
+    core._request_json("https://example/api", {"any": "x", "startRecord": 2})
+    assert slept == [2.0]
+
+    core._load_from_cache = Mock(return_value={"_meta": {"t": 0.0}, "body": {"numberOfRecords": 0}})
+    core._request_json("https://example/api", {"any": "x", "startRecord": 3})
+    assert slept == [2.0]
+    assert session.get.call_count == 2
+
+
+def test_default_session_mounts_pooled_retrying_adapter():
+    core = core_mod._DietCore()
+    adapter = core.session.get_adapter("https://kokkai.ndl.go.jp/api/speech")
+
+    assert adapter._pool_maxsize == core_mod._POOL_MAXSIZE
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_default_pool_covers_max_workers_and_plain_http():
+    core = core_mod._DietCore(max_workers=64, base_url="http://localhost:8000/api")
+
+    https = core.session.get_adapter("https://kokkai.ndl.go.jp/api/speech")
+    assert core.session.get_adapter("http://localhost:8000/api/speech") is https
+    assert https._pool_maxsize == 64
+
+
+def test_user_session_adapters_are_left_alone():
+    session = requests.Session()
+    before = session.get_adapter("https://kokkai.ndl.go.jp/api/speech")
+
+    core = core_mod._DietCore(session=session)
+
+    assert core.session.get_adapter("https://kokkai.ndl.go.jp/api/speech") is before
+
+
+@pytest.mark.parametrize("params", [{}, {"maximumRecords": 10}, {"any": ""}, {"speaker": None, "startRecord": 1}])
+def test_check_required_any_condition_rejects_missing_conditions(params):
+    with pytest.raises(DietSearchAPIError):
+        core_mod._DietCore().check_required_any_condition(params)
+
+
+def test_check_required_any_condition_accepts_any_condition():
+    core_mod._DietCore().check_required_any_condition({"maximumRecords": 10, "from": "2024-01-01"})
@@ -1,7 +1,15 @@
 import importlib
+import subprocess
+import sys
 
 
 def test_import_package():
     pkg = importlib.import_module("jp_diet_search")
     assert pkg is not None
     assert hasattr(pkg, "DietClient")
+
+
+def test_cli_import_defers_heavy_dependencies():
+    code = "import sys, jp_diet_search.cli; print(sorted({'requests', 'pydantic'} & set(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
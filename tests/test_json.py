@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from jp_diet_search._json import dumps_bytes, loads
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_dumps_bytes_handles_ints_wider_than_64_bits(indent):
+    obj = {"n": 2**70, "m": -(2**65)}
+
+    assert json.loads(dumps_bytes(obj, indent=indent)) == obj
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_dumps_bytes_is_equivalent_json(indent):
+    obj = {"f": [1e16, 1e-7, 0.1], "s": "科学技術", "b": True, "z": None}
+
+    assert loads(dumps_bytes(obj, indent=indent)) == obj
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from jp_diet_search.models import MeetingListResult, SpeechRecord, SpeechSearchResult
+
+
+def test_speech_search_result_from_search():
+    res = {
+        "numberOfRecords": 2,
+        "records": [
+            {"speechID": "s1", "speaker": "A", "speechOrder": 1},
+            {"speechID": "s2", "speaker": "B", "speechOrder": "2"},
+        ],
+    }
+
+    parsed = SpeechSearchResult.from_search(res)
+
+    assert parsed.number_of_records == 2
+    assert all(isinstance(r, SpeechRecord) for r in parsed.records)
+    assert [r.speech_order for r in parsed.records] == [1, 2]
+
+
+def test_meeting_list_result_from_search_nests_speeches():
+    res = {
+        "numberOfRecords": 1,
+        "records": [{"issueID": "m1", "speechRecord": [{"speechID": "s1"}]}],
+    }
+
+    parsed = MeetingListResult.from_search(res)
+
+    assert parsed.records[0].issue_id == "m1"
+    assert parsed.records[0].speech_records[0].speech_id == "s1"
+
+
+def test_from_search_raises_validation_error():
+    with pytest.raises(ValidationError):
+        SpeechSearchResult.from_search({"numberOfRecords": 1, "records": [{"speaker": "no id"}]})
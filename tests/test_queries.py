@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from jp_diet_search.queries import MeetingListQuery, SpeechQuery
+
+
+def test_to_params_uses_api_parameter_names():
+    q = SpeechQuery(
+        any="予算",
+        from_date="2024-01-01",
+        maximum_records=5,
+        speech_id="x",
+        issue_from=1,
+        supplement_and_appendix=True,
+    )
+
+    assert q.to_params() == {
+        "maximumRecords": 5,
+        "recordPacking": "json",
+        "any": "予算",
+        "from": "2024-01-01",
+        "supplementAndAppendix": True,
+        "speechID": "x",
+        "issueFrom": 1,
+    }
+
+
+def test_query_accepts_api_parameter_names():
+    q = MeetingListQuery.model_validate({"nameOfHouse": "衆議院", "maximumRecords": 10})
+
+    assert q.name_of_house == "衆議院"
+    assert q.to_params()["maximumRecords"] == 10